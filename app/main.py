@@ -1,8 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from .routes import simulations, optimizations
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 # configure CORS
@@ -11,11 +13,15 @@ origins = ["*"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_credentials=False,
+    allow_methods=["GET"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
+# compress large responses such as the 1000 simulated values
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
 # routes
 app.include_router(simulations.router)
 app.include_router(optimizations.router)
@@ -1,4 +1,8 @@
+import asyncio
+import functools
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from ortools.linear_solver import pywraplp
 
 router = APIRouter(
@@ -12,7 +16,7 @@ router = APIRouter(
 # @route GET /api/optimizations/staffing
 # @access public
 @router.get("/staffing")
-def optimization_staffing(
+async def optimization_staffing(
     monday: int,
     tuesday: int,
     wednesday: int,
@@ -53,6 +57,31 @@ def optimization_staffing(
     sundayStaff = number of Sunday staff\n
     """
 
+    payload = await asyncio.to_thread(
+        _optimization_staffing,
+        monday,
+        tuesday,
+        wednesday,
+        thursday,
+        friday,
+        saturday,
+        sunday,
+    )
+    return ORJSONResponse(payload)
+
+
+# each request builds and solves a fresh model, so the returned plan only depends
+# on the requirements and is safe to cache
+@functools.lru_cache(maxsize=1024)
+def _optimization_staffing(
+    monday: int,
+    tuesday: int,
+    wednesday: int,
+    thursday: int,
+    friday: int,
+    saturday: int,
+    sunday: int,
+):
     # create solver
     solver = pywraplp.Solver.CreateSolver("SCIP")
 
@@ -134,7 +163,6 @@ def optimization_staffing(
     # solve
     solver.Minimize(obj_func)
     status = solver.Solve()
-    # print results
     if status == pywraplp.Solver.OPTIMAL:
         return {
             "objFuncVal": solver.Objective().Value(),
@@ -1,6 +1,15 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import functools
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 import numpy as np
-from ..utils.utils import generate_stats, is_triangular, is_truncated_normal
+from ..utils.utils import (
+    determine_distribution,
+    generate_stats,
+    production_profits,
+    truncated_normal,
+)
 
 router = APIRouter(
     prefix="/api/simulations",
@@ -8,12 +17,20 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# 1000 realized demand samples for each distribution returned by determine_distribution
+DEMAND_DISTRIBUTIONS = {
+    "triangular": lambda rng, min, mode, max, sd: rng.triangular(min, mode, max, 1000),
+    "truncated_normal": lambda rng, min, mean, max, sd: truncated_normal(
+        rng, min, mean, max, sd, 1000
+    ),
+}
+
 
 # @desc Monte Carlo simulation for production planning
 # @route GET /api/simulations/production
 # @access public
 @router.get("/production")
-def simulation_production(
+async def simulation_production(
     productionQuantity: float,
     unitCost: float,
     unitPrice: float,
@@ -23,6 +40,7 @@ def simulation_production(
     demandMode: float,
     demandMax: float,
     demandSD: float,
+    seed: int = Query(42, ge=0),
 ):
     """
     Monte Carlo simulation for production planning
@@ -38,6 +56,7 @@ def simulation_production(
     demandMode: average forecasted demand\n
     demandMax: maximum forecasted demand\n
     demandSD: standard deviation forecasted demand\n
+    seed: non-negative random seed. the same inputs and seed always return the same simulations\n
 
     RETURNS:
 
@@ -56,45 +75,66 @@ def simulation_production(
     simulatedProfits: 1000 simulated profits
 
     """
-    # set seed
-    rng = np.random.default_rng(seed=42)
+    # returning the response directly skips jsonable_encoder. orjson serializes the
+    # float32 array with shortest float32 reprs and writes non-finite floats as null
+    payload = await asyncio.to_thread(
+        _simulation_production,
+        productionQuantity,
+        unitCost,
+        unitPrice,
+        salvagePrice,
+        fixedCost,
+        demandMin,
+        demandMode,
+        demandMax,
+        demandSD,
+        seed,
+    )
+    return ORJSONResponse(payload)
 
-    # define truncated normal function
-    def truncated_normal(min: float, mean: float, max: float, sd: float) -> float:
-        value = rng.normal(mean, sd)
-        if value < min or value > max:
-            value = truncated_normal(min, max, mean, sd)
-        return value
+
+# results only depend on the inputs and seed, so repeated queries are served from memory
+@functools.lru_cache(maxsize=1024)
+def _simulation_production(
+    productionQuantity: float,
+    unitCost: float,
+    unitPrice: float,
+    salvagePrice: float,
+    fixedCost: float,
+    demandMin: float,
+    demandMode: float,
+    demandMax: float,
+    demandSD: float,
+    seed: int,
+):
+    # set seed
+    rng = np.random.default_rng(seed=seed)
 
     # define demand distribution based on provided values
-    if is_triangular(demandMin, demandMode, demandMax, demandSD):
-        demand_distribution = rng.triangular(demandMin, demandMode, demandMax, 1000)
-    elif is_truncated_normal(demandMin, demandMode, demandMax, demandSD):
-        demand_distribution = [
-            truncated_normal(demandMin, demandMode, demandMax, demandSD)
-            for _ in range(0, 1000)
-        ]
-    else:
+    distribution = determine_distribution(demandMin, demandMode, demandMax, demandSD)
+    if distribution is None:
         raise HTTPException(
             status_code=400,
             detail="Please check that (min <= mean <= max) and (min < max) and (sd >= 0)",
         )
+    demand_distribution = DEMAND_DISTRIBUTIONS[distribution](
+        rng, demandMin, demandMode, demandMax, demandSD
+    )
 
-    # define simulation
-    def simulation():
-        # profit = sales revenue + salvage revenue - production costs - fixed costs
-        # pick a random demand value
-        realized_demand: float = rng.choice(demand_distribution)
-        units_sold = min(productionQuantity, realized_demand)
-        units_salvaged = productionQuantity - units_sold
-        production_cost = productionQuantity * unitCost
-        revenue_from_sales = units_sold * unitPrice
-        revenue_from_salvage = units_salvaged * salvagePrice
-        profit = revenue_from_sales + revenue_from_salvage - production_cost - fixedCost
-        return profit
-
-    # run 1000 simulations
-    simulated_profits = [simulation() for _ in range(0, 1000)]
+    # run 1000 simulations, one per demand sample. the samples are already iid,
+    # so resampling them with replacement would only add noise
+    profits = production_profits(
+        demand_distribution,
+        productionQuantity,
+        unitCost,
+        unitPrice,
+        salvagePrice,
+        fixedCost,
+    )
+    # stats use full precision, the simulated values are only sent to clients
+    simulated_profits = profits.astype(np.float32)
+    # cached results are shared between requests
+    simulated_profits.flags.writeable = False
 
     # generate stats
     (
@@ -110,7 +150,7 @@ def simulation_production(
         p_lose_money,
         p_lose_money_lower_ci,
         p_lose_money_upper_ci,
-    ) = generate_stats(simulated_profits)
+    ) = generate_stats(profits)
 
     return {
         "minimum": minimum,
@@ -1,6 +1,7 @@
 from fastapi.testclient import TestClient
 
 from ..main import app
+from .optimizations import _optimization_staffing
 
 client = TestClient(app)
 
@@ -27,3 +28,31 @@ def test_staffing_optimization():
     assert response.status_code == 200
     # check for accuracy. answer should be between 22 and 24
     assert 22 <= objFuncVal <= 24
+
+
+# @desc Test staffing optimization does not depend on previously solved requirements
+# @route GET /api/optimizations/staffing
+def test_staffing_optimization_sequential_requests():
+    requirements = (17, 13, 15, 19, 14, 16, 11)
+    # call the uncached core so every call actually solves
+    result = _optimization_staffing.__wrapped__(*requirements)
+    result_no_staff = _optimization_staffing.__wrapped__(0, 0, 0, 0, 0, 0, 0)
+    result_other = _optimization_staffing.__wrapped__(5, 20, 3, 8, 12, 1, 9)
+    result_two = _optimization_staffing.__wrapped__(*requirements)
+
+    # check that lowering the requirements lowers the objective
+    assert result_no_staff["objFuncVal"] == 0
+    # check that the same requirements give the same staffing plan
+    assert result_other != result
+    assert result_two == result
+
+
+# @desc Test cached staffing optimization matches a fresh solve
+# @route GET /api/optimizations/staffing
+def test_staffing_optimization_cache_matches_fresh_solve():
+    requirements = (17, 13, 15, 19, 14, 16, 11)
+    cached = _optimization_staffing(*requirements)
+    _optimization_staffing.__wrapped__(5, 20, 3, 8, 12, 1, 9)
+
+    # check that the cached plan is the plan a fresh solve returns
+    assert _optimization_staffing.__wrapped__(*requirements) == cached
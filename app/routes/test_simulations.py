@@ -1,6 +1,8 @@
 from fastapi.testclient import TestClient
+import numpy as np
 
 from ..main import app
+from .simulations import _simulation_production
 
 client = TestClient(app)
 
@@ -23,23 +25,22 @@ def test_simulations_production_triangular():
         "/api/simulations/production",
         params=params,
     )
-    response_two = client.get(
-        "/api/simulations/production",
-        params=params,
-    )
+    # run the uncached simulation twice in-process for the reproducibility check
+    result = _simulation_production.__wrapped__(**params, seed=42)
+    result_two = _simulation_production.__wrapped__(**params, seed=42)
     # check status code
     assert response.status_code == 200
     # check that 1000 values were returned
     profits = response.json()["simulatedProfits"]
-    profits_two = response_two.json()["simulatedProfits"]
     mean = response.json()["mean"]
     assert len(profits) == 1000
     # check that the 1000 values are reproducible with the same inputs
-    assert profits == profits_two
+    assert np.array_equal(result["simulatedProfits"], result_two["simulatedProfits"])
+    assert np.array_equal(np.float32(profits), result["simulatedProfits"])
     # check that the 1000 values are not identical
     assert min(profits) < max(profits)
-    # check for accuracy. the mean profit with these inputs should be between 47,000 and 49,000
-    assert 47000 <= mean <= 49000
+    # check for accuracy. the expected mean profit with these inputs is about 49,400
+    assert 48000 <= mean <= 51000
 
 
 # @desc Test production simulation with truncated normal distribution
@@ -60,20 +61,150 @@ def test_simulations_production_truncated_normal():
         "/api/simulations/production",
         params=params,
     )
-    response_two = client.get(
-        "/api/simulations/production",
-        params=params,
-    )
+    # run the uncached simulation twice in-process for the reproducibility check
+    result = _simulation_production.__wrapped__(**params, seed=42)
+    result_two = _simulation_production.__wrapped__(**params, seed=42)
     # check status code
     assert response.status_code == 200
     # check that 1000 values were returned
     profits = response.json()["simulatedProfits"]
-    profits_two = response_two.json()["simulatedProfits"]
     mean = response.json()["mean"]
     assert len(profits) == 1000
     # check that the 1000 values are reproducible with the same inputs
-    assert profits == profits_two
+    assert np.array_equal(result["simulatedProfits"], result_two["simulatedProfits"])
+    assert np.array_equal(np.float32(profits), result["simulatedProfits"])
     # check that the 1000 values are not identical
     assert min(profits) < max(profits)
-    # check for accuracy. the mean profit with these inputs should be between 47,000 and 49,000
-    assert 47000 <= mean <= 49000
+    # check for accuracy. the expected mean profit with these inputs is about 47,500
+    assert 45500 <= mean <= 49500
+
+
+# @desc Test production simulation with a truncated normal far narrower than its sd
+# @route GET /api/simulations/production
+def test_simulations_production_truncated_normal_narrow_bounds():
+    params = {
+        "unitCost": 80,
+        "unitPrice": 100,
+        "salvagePrice": 30,
+        "fixedCost": 100000,
+        "productionQuantity": 7800,
+        "demandMin": 7000,
+        "demandMode": 7000,
+        "demandMax": 7001,
+        "demandSD": 1000000,
+    }
+    response = client.get(
+        "/api/simulations/production",
+        params=params,
+    )
+    # check status code
+    assert response.status_code == 200
+    # check that 1000 values were returned
+    profits = response.json()["simulatedProfits"]
+    assert len(profits) == 1000
+    # check that every demand stayed within bounds. profit is linear in demand below productionQuantity
+    min_profit = 7000 * 100 + 800 * 30 - 7800 * 80 - 100000
+    max_profit = 7001 * 100 + 799 * 30 - 7800 * 80 - 100000
+    assert min_profit <= min(profits) <= max(profits) <= max_profit
+
+
+# @desc Test production simulation returns different values for different seeds
+# @route GET /api/simulations/production
+def test_simulations_production_seed():
+    params = {
+        "unitCost": 80,
+        "unitPrice": 100,
+        "salvagePrice": 30,
+        "fixedCost": 100000,
+        "productionQuantity": 7800,
+        "demandMin": 5000,
+        "demandMode": 12000,
+        "demandMax": 16000,
+        "demandSD": 0,
+    }
+    response = client.get(
+        "/api/simulations/production",
+        params=params,
+    )
+    response_two = client.get(
+        "/api/simulations/production",
+        params={**params, "seed": 7},
+    )
+    # check status codes
+    assert response.status_code == 200
+    assert response_two.status_code == 200
+    # check that a different seed gives different values
+    profits = response.json()["simulatedProfits"]
+    profits_two = response_two.json()["simulatedProfits"]
+    assert profits != profits_two
+
+
+# @desc Test production simulation rejects a negative seed
+# @route GET /api/simulations/production
+def test_simulations_production_negative_seed():
+    params = {
+        "unitCost": 80,
+        "unitPrice": 100,
+        "salvagePrice": 30,
+        "fixedCost": 100000,
+        "productionQuantity": 7800,
+        "demandMin": 5000,
+        "demandMode": 12000,
+        "demandMax": 16000,
+        "demandSD": 0,
+        "seed": -1,
+    }
+    response = client.get(
+        "/api/simulations/production",
+        params=params,
+    )
+    # check status code
+    assert response.status_code == 422
+
+
+# @desc Test production simulation response is gzip compressed when accepted
+# @route GET /api/simulations/production
+def test_simulations_production_gzip():
+    params = {
+        "unitCost": 80,
+        "unitPrice": 100,
+        "salvagePrice": 30,
+        "fixedCost": 100000,
+        "productionQuantity": 7800,
+        "demandMin": 5000,
+        "demandMode": 12000,
+        "demandMax": 16000,
+        "demandSD": 0,
+    }
+    response = client.get(
+        "/api/simulations/production",
+        params=params,
+        headers={"Accept-Encoding": "gzip"},
+    )
+    # check status code
+    assert response.status_code == 200
+    # check that the body was compressed
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.num_bytes_downloaded < len(response.content)
+
+
+# @desc Test production simulation rejects an invalid demand distribution
+# @route GET /api/simulations/production
+def test_simulations_production_invalid_distribution():
+    params = {
+        "unitCost": 80,
+        "unitPrice": 100,
+        "salvagePrice": 30,
+        "fixedCost": 100000,
+        "productionQuantity": 7800,
+        "demandMin": 16000,
+        "demandMode": 12000,
+        "demandMax": 5000,
+        "demandSD": 0,
+    }
+    response = client.get(
+        "/api/simulations/production",
+        params=params,
+    )
+    # check status code
+    assert response.status_code == 400
@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+
+from .main import app
+
+client = TestClient(app)
+
+
+# @desc Test CORS preflight allows any origin without credentials and is cacheable
+# @route OPTIONS /api/optimizations/staffing
+def test_cors_preflight():
+    response = client.options(
+        "/api/optimizations/staffing",
+        headers={
+            "Origin": "https://example.com",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+
+    # check status code
+    assert response.status_code == 200
+    # check that the wildcard origin is returned as is, so responses stay cacheable
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in response.headers
+    # check that browsers may cache the preflight for a day
+    assert response.headers["access-control-max-age"] == "86400"
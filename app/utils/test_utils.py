@@ -0,0 +1,36 @@
+import numpy as np
+
+from .utils import generate_stats
+
+
+# @desc Test summary statistics of simulated values
+def test_generate_stats():
+    values = np.arange(-100.0, 900.0)
+    (
+        minimum,
+        value_at_risk,
+        q1,
+        median,
+        q3,
+        maximum,
+        mean,
+        mean_lower_ci,
+        mean_upper_ci,
+        p_lose_money,
+        p_lose_money_lower_ci,
+        p_lose_money_upper_ci,
+    ) = generate_stats(values)
+
+    # check order statistics
+    assert minimum == -100
+    assert maximum == 899
+    assert value_at_risk == np.percentile(values, 5)
+    assert (q1, median, q3) == (149.75, 399.5, 649.25)
+    # check the mean and its 95% confidence interval
+    assert mean == 399.5
+    assert np.isclose(mean_upper_ci - mean, 1.96 * np.std(values) / np.sqrt(1000))
+    assert np.isclose(mean - mean_lower_ci, mean_upper_ci - mean)
+    # check the probability of losing money and its 95% confidence interval
+    assert p_lose_money == 0.1
+    assert np.isclose(p_lose_money_upper_ci - p_lose_money, 1.96 * np.sqrt(0.09 / 1000))
+    assert np.isclose(p_lose_money - p_lose_money_lower_ci, 0.0186, atol=1e-4)
@@ -1,31 +1,74 @@
+from typing import Optional
+
 import numpy as np
+from scipy.stats import truncnorm
+
 
+def determine_distribution(
+    min: float, mode: float, max: float, sd: float
+) -> Optional[str]:
+    # both distributions need (min <= mode <= max) and (min < max), sd picks which
+    if not (min <= mode <= max and min < max):
+        return None
+    if sd == 0:
+        return "triangular"
+    if sd > 0:
+        return "truncated_normal"
+    return None
 
-def is_triangular(min: float, mode: float, max: float, sd: float):
-    return (min <= mode <= max) and (min < max) and (sd == 0)
 
+def truncated_normal(
+    rng: np.random.Generator,
+    min: float,
+    mean: float,
+    max: float,
+    sd: float,
+    size: int = 1000,
+) -> np.ndarray:
+    # scipy samples the standardized bounds by inverse CDF, in log space for the tails
+    return truncnorm.rvs(
+        (min - mean) / sd,
+        (max - mean) / sd,
+        loc=mean,
+        scale=sd,
+        size=size,
+        random_state=rng,
+    )
 
-def is_truncated_normal(min: float, mean: float, max: float, sd: float):
-    return (min <= mean <= max) and (min < max) and (sd > 0)
 
+def production_profits(
+    demand: np.ndarray,
+    production_quantity: float,
+    unit_cost: float,
+    unit_price: float,
+    salvage_price: float,
+    fixed_cost: float,
+) -> np.ndarray:
+    # profit = sales revenue + salvage revenue - production costs - fixed costs
+    units_sold = np.minimum(production_quantity, demand)
+    units_salvaged = production_quantity - units_sold
+    production_cost = production_quantity * unit_cost
+    revenue_from_sales = units_sold * unit_price
+    revenue_from_salvage = units_salvaged * salvage_price
+    return revenue_from_sales + revenue_from_salvage - production_cost - fixed_cost
 
-def generate_stats(values: list[float]):
+
+def generate_stats(values: np.ndarray):
     minimum = np.min(values)
-    value_at_risk = min(np.percentile(values, 5), 0)
-    q1 = np.percentile(values, 25)
-    median = np.percentile(values, 50)
-    q3 = np.percentile(values, 75)
+    # one call partitions the values once for all percentiles
+    p5, q1, median, q3 = np.percentile(values, [5, 25, 50, 75])
+    value_at_risk = min(p5, 0)
     maximum = np.max(values)
     mean_profit = np.mean(values)
-    mean_profit_lower_ci = mean_profit - 1.96 * np.std(values) / np.sqrt(len(values))
-    mean_profit_upper_ci = mean_profit + 1.96 * np.std(values) / np.sqrt(len(values))
-    p_lose_money = sum(profit < 0 for profit in values) / len(values)
-    p_lose_money_lower_ci = p_lose_money - 1.96 * np.sqrt(
-        p_lose_money * (1 - p_lose_money) / len(values)
-    )
-    p_lose_money_upper_ci = p_lose_money + 1.96 * np.sqrt(
-        p_lose_money * (1 - p_lose_money) / len(values)
+    mean_profit_margin = 1.96 * np.std(values) / np.sqrt(values.size)
+    mean_profit_lower_ci = mean_profit - mean_profit_margin
+    mean_profit_upper_ci = mean_profit + mean_profit_margin
+    p_lose_money = np.count_nonzero(values < 0) / values.size
+    p_lose_money_margin = 1.96 * np.sqrt(
+        p_lose_money * (1 - p_lose_money) / values.size
     )
+    p_lose_money_lower_ci = p_lose_money - p_lose_money_margin
+    p_lose_money_upper_ci = p_lose_money + p_lose_money_margin
     return (
         minimum,
         value_at_risk,